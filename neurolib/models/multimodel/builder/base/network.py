@@ -206,7 +206,7 @@ class Node(BackendIntegrator):
         for mass in self:
             mass.init_mass(**kwargs)
         assert all(mass.initialised for mass in self)
-        self._initial_state = np.array(sum([mass.initial_state for mass in self], []))
+        self._initial_state = np.concatenate([mass.initial_state for mass in self])
         self.initialised = True
 
     def _sanitize_update_params(self, params_dict):
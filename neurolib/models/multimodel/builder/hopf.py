@@ -48,13 +48,14 @@ class HopfMass(NeuralMass):
         Initialize state vector.
         """
         np.random.seed(self.seed)
-        self.initial_state = (0.5 * np.random.uniform(-1, 1, size=(self.num_state_variables,))).tolist()
+        self.initial_state = 0.5 * np.random.uniform(-1, 1, size=(self.num_state_variables,))
 
     def _derivatives(self, coupling_variables):
         [x, y] = self._unwrap_state_vector()
+        amplitude = self.params["a"] - x ** 2 - y ** 2
 
         d_x = (
-            (self.params["a"] - x ** 2 - y ** 2) * x
+            amplitude * x
             - self.params["w"] * y
             + coupling_variables["network_x"]
             + system_input(self.noise_input_idx[0])
@@ -62,7 +63,7 @@ class HopfMass(NeuralMass):
         )
 
         d_y = (
-            (self.params["a"] - x ** 2 - y ** 2) * y
+            amplitude * y
             + self.params["w"] * x
             + coupling_variables["network_y"]
             + system_input(self.noise_input_idx[1])
@@ -200,11 +200,13 @@ def timeIntegration_njit_elementwise(
             noise_exc[no] = excs[no, i]
             noise_inh[no] = inhs[no, i]
 
-            # delayed input to each node
-            exc_input_d[no] = 0
+            # delayed input to each node, accumulated in a local scalar
+            exc_input = 0.0
 
             for l in range(N):
-                exc_input_d[no] += K_gl * Cmat[no, l] * (excs[l, i - Dmat_ndt[no, l] - 1])
+                exc_input += K_gl * Cmat[no, l] * (excs[l, i - Dmat_ndt[no, l] - 1])
+
+            exc_input_d[no] = exc_input
 
             # Wilson-Cowan model
             exc_rhs = (